@@ -3,9 +3,13 @@ Streamlit Web Application for JIS to SJIS2004 Character Conversion
 """
 
 import streamlit as st
-import pyperclip
 from convert import convert_jis_code
 
+# Markup around the converted character, joined with it on each render
+_RESULT_PRE = "<div style='text-align: center; font-size: 80px; margin: 20px 0;'>"
+_RESULT_POST = "</div>"
+
+
 def main():
     """Main Streamlit application"""
     
@@ -39,7 +43,7 @@ def main():
             
             # Large character display
             st.markdown(
-                f"<div style='text-align: center; font-size: 80px; margin: 20px 0;'>{result}</div>",
+                _RESULT_PRE + result + _RESULT_POST,
                 unsafe_allow_html=True
             )
             
@@ -57,14 +61,14 @@ def main():
                     
                     with col1:
                         st.write("**JIS Coordinates:**")
-                        st.write(f"• Area: {debug_info['area']}")
-                        st.write(f"• Ku: {debug_info['ku']:02d}")
-                        st.write(f"• Ten: {debug_info['ten']:02d}")
+                        st.write(f"• Area: {debug_info.area}")
+                        st.write(f"• Ku: {debug_info.ku:02d}")
+                        st.write(f"• Ten: {debug_info.ten:02d}")
                     
                     with col2:
                         st.write("**Shift JIS:**")
-                        st.write(f"• Bytes: {debug_info['sjis_hex']}")
-                        st.write(f"• Decimal: {debug_info['sjis_bytes']}")
+                        st.write(f"• Bytes: {debug_info.sjis_hex}")
+                        st.write(f"• Decimal: {debug_info.sjis_bytes}")
         
         else:
             # Display error
@@ -73,7 +77,7 @@ def main():
             
             if debug_info:
                 with st.expander("🔍 Debug Information"):
-                    st.json(debug_info)
+                    st.json(debug_info.as_dict())
     
     elif jis_input and len(jis_input) < 5:
         st.info(f"Enter {5 - len(jis_input)} more digit(s) to convert")
@@ -2,8 +2,21 @@
 JIS to SJIS2004 conversion utilities
 """
 
-def calculate_s1(m, k):
-    """Calculate S1 byte for SJIS conversion"""
+import codecs
+import hashlib
+import os
+import re
+import warnings
+from collections import namedtuple
+from functools import lru_cache
+
+
+# Resolved once so each decode skips the codec registry lookup
+_DECODE_2004 = codecs.getdecoder("shift_jis_2004")
+
+
+def _calc_s1(m, k):
+    """Compute S1 byte for SJIS conversion from the JIS formulas"""
     if m == 1:
         if 1 <= k <= 62:
             return (k + 0x101) // 2
@@ -17,8 +30,8 @@ def calculate_s1(m, k):
     return None
 
 
-def calculate_s2(k, t):
-    """Calculate S2 byte for SJIS conversion"""
+def _calc_s2(k, t):
+    """Compute S2 byte for SJIS conversion from the JIS formulas"""
     if k % 2 == 1:  # k が奇数の場合
         if 1 <= t <= 63:
             return t + 0x3F
@@ -29,6 +42,46 @@ def calculate_s2(k, t):
     return None
 
 
+# The formulas evaluated once for every index: S1 by [m][k], S2 by [k & 1][t]
+_S1 = (
+    (None,) * 95,  # Area 0 does not exist
+    tuple(_calc_s1(1, k) for k in range(95)),
+    tuple(_calc_s1(2, k) for k in range(95)),
+)
+_S2 = (
+    tuple(_calc_s2(2, t) for t in range(95)),  # k が偶数の場合
+    tuple(_calc_s2(1, t) for t in range(95)),  # k が奇数の場合
+)
+
+
+def calculate_s1(m, k):
+    """Calculate S1 byte for SJIS conversion"""
+    if m not in (1, 2) or not 0 <= k <= 94:
+        return None
+    return _S1[m][k]
+
+
+def calculate_s2(k, t):
+    """Calculate S2 byte for SJIS conversion"""
+    if not 0 <= t <= 94:
+        return None
+    return _S2[k & 1][t]
+
+
+def _invalid_code_reason(m, k, t):
+    """Describe why area-ku-ten coordinates have no Shift JIS equivalent"""
+    if not (1 <= m <= 2):
+        return f"Invalid area number: {m}. Must be 1 or 2."
+    
+    if not (1 <= k <= 94):
+        return f"Invalid ku number: {k}. Must be between 1 and 94."
+    
+    if not (1 <= t <= 94):
+        return f"Invalid ten number: {t}. Must be between 1 and 94."
+    
+    return "Invalid input for JIS to Shift JIS conversion."
+
+
 def jis_to_sjis(m, k, t):
     """
     Convert JIS area-ku-ten coordinates to Shift JIS bytes
@@ -39,26 +92,18 @@ def jis_to_sjis(m, k, t):
         t (int): Ten number (4th-5th digits)
     
     Returns:
-        tuple: (s1, s2) Shift JIS first and second bytes
-    
-    Raises:
-        ValueError: If coordinates are out of valid range
+        tuple: (s1, s2) Shift JIS first and second bytes, or None if the
+        coordinates are out of valid range (see _invalid_code_reason)
     """
     # Validate input ranges
-    if not (1 <= m <= 2):
-        raise ValueError(f"Invalid area number: {m}. Must be 1 or 2.")
-    
-    if not (1 <= k <= 94):
-        raise ValueError(f"Invalid ku number: {k}. Must be between 1 and 94.")
+    if not (1 <= m <= 2 and 1 <= k <= 94 and 1 <= t <= 94):
+        return None
     
-    if not (1 <= t <= 94):
-        raise ValueError(f"Invalid ten number: {t}. Must be between 1 and 94.")
-    
-    s1 = calculate_s1(m, k)
-    s2 = calculate_s2(k, t)
+    s1 = _S1[m][k]
+    s2 = _S2[k & 1][t]
 
     if s1 is None or s2 is None:
-        raise ValueError("Invalid input for JIS to Shift JIS conversion.")
+        return None
 
     return s1, s2
 
@@ -72,18 +117,173 @@ def sjis_to_unicode(s1, s2):
         s2 (int): Second Shift JIS byte
     
     Returns:
-        str: Unicode character
+        str: Unicode character, or None if the bytes cannot be decoded
+    """
+    if not (0 <= s1 <= 0xFF and 0 <= s2 <= 0xFF):
+        return None
+    if 0x81 <= s1 <= 0xFC and 0x40 <= s2 <= 0xFC:
+        return _pair_table()[(s1 << 8) | s2]
     
-    Raises:
-        UnicodeDecodeError: If bytes cannot be decoded
+    # Outside the double-byte ranges covered by _pair_table(), e.g. a pair
+    # of single-byte characters: decode directly
+    try:
+        return _DECODE_2004(bytes((s1, s2)))[0]
+    except UnicodeDecodeError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _pair_table():
     """
-    sjis_bytes = bytearray([s1, s2])
-    return sjis_bytes.decode("sjis_2004")
+    Decode every double-byte Shift JIS pair once, on first use
 
+    Returns:
+        list: 65536 entries indexed by (s1 << 8) | s2, holding the decoded
+        character or None where the pair is not valid SJIS2004. Only lead
+        bytes 0x81-0xFC with trail bytes 0x40-0xFC are filled in.
+    """
+    table = [None] * 0x10000
+    for s1 in range(0x81, 0xFD):
+        for s2 in range(0x40, 0xFD):
+            try:
+                table[(s1 << 8) | s2] = _DECODE_2004(bytes((s1, s2)))[0]
+            except UnicodeDecodeError:
+                pass
+    return table
 
-def convert_jis_code(jis_input):
+
+# Precomputed code -> character table, see tools/build_lut.py. The file
+# starts with _LUT_FINGERPRINT, then record i holds code
+# i = m*10000 + k*100 + t as _LUT_CODE_POINTS UTF-32-LE code points,
+# NUL-padded, or only NULs if the code has no character.
+_LUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lut.bin")
+_LUT_CODE_POINTS = 2  # Combining sequences decode to two code points
+_LUT_RECORD_SIZE = _LUT_CODE_POINTS * 4
+_LUT_ENTRIES = 30000  # Areas 0-2; higher areas are never valid
+
+# Digest of the S1/S2 tables, so a lut.bin generated before a formula
+# change is detected and not served
+_LUT_FINGERPRINT = hashlib.sha256(repr((_S1, _S2)).encode("ascii")).digest()
+_LUT_FILE_SIZE = len(_LUT_FINGERPRINT) + _LUT_ENTRIES * _LUT_RECORD_SIZE
+
+
+def _build_lut_bytes():
     """
-    Convert a 5-digit JIS area-ku-ten code to Unicode character
+    Convert every area-ku-ten code once and pack the results
+
+    Returns:
+        bytes: Contents of lut.bin, fingerprint header included
+    """
+    table = bytearray(_LUT_ENTRIES * _LUT_RECORD_SIZE)
+    for m in (1, 2):
+        for k in range(1, 95):
+            for t in range(1, 95):
+                sjis = jis_to_sjis(m, k, t)
+                if sjis is None:
+                    continue
+                char = sjis_to_unicode(*sjis)
+                if char is None:
+                    continue
+                encoded = char.ljust(_LUT_CODE_POINTS, "\0").encode("utf-32-le")
+                offset = (m * 10000 + k * 100 + t) * _LUT_RECORD_SIZE
+                table[offset:offset + _LUT_RECORD_SIZE] = encoded
+    return _LUT_FINGERPRINT + bytes(table)
+
+
+def _load_lut():
+    """
+    Read lut.bin into one string, building the table in memory if it is
+    missing or out of date
+
+    Returns:
+        tuple: (chars, combined) where chars[i] is the first code point of
+        code i ("\\0" if it has no character) and combined maps the few codes
+        that decode to two code points to their full string
+    """
+    try:
+        with open(_LUT_PATH, "rb") as f:
+            data = f.read()
+    except OSError:
+        data = None
+
+    decoded = None
+    if data is not None:
+        if len(data) == _LUT_FILE_SIZE and data.startswith(_LUT_FINGERPRINT):
+            try:
+                decoded = data[len(_LUT_FINGERPRINT):].decode("utf-32-le")
+            except UnicodeDecodeError:
+                pass
+        if decoded is None:
+            warnings.warn(
+                "lut.bin does not match convert.py; "
+                "regenerate it with python tools/build_lut.py",
+                RuntimeWarning
+            )
+    if decoded is None:
+        data = _build_lut_bytes()
+        decoded = data[len(_LUT_FINGERPRINT):].decode("utf-32-le")
+
+    chars = decoded[0::_LUT_CODE_POINTS]
+    combined = {
+        match.start(): chars[match.start()] + match.group()
+        for match in re.finditer("[^\0]", decoded[1::_LUT_CODE_POINTS])
+    }
+    return chars, combined
+
+
+_LUT_CHARS, _LUT_COMBINED = _load_lut()
+
+
+def _lut_char(index):
+    """Return the precomputed character for code index m*10000 + k*100 + t, or None"""
+    if index >= _LUT_ENTRIES:
+        return None
+    char = _LUT_CHARS[index]
+    if char == "\0":
+        return None
+    return _LUT_COMBINED.get(index, char)
+
+
+# Exactly five ASCII digits
+_FIVE_DIGIT = re.compile(r"\A[0-9]{5}\Z").match
+
+
+_DEBUG_INFO_FIELDS = ('area', 'ku', 'ten', 's1', 's2', 'sjis_bytes', 'sjis_hex')
+
+
+class DebugInfo(namedtuple('DebugInfo', _DEBUG_INFO_FIELDS)):
+    """
+    Immutable conversion details for a parsed JIS code
+    
+    s1 and s2 are None when the code has no Shift JIS equivalent. The
+    formatted sjis_bytes/sjis_hex strings are stored rather than computed
+    on access: the conversion result is cached, and app.py reads them on
+    every rerun.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def build(cls, area, ku, ten, s1=None, s2=None):
+        """Create a DebugInfo, formatting the Shift JIS bytes once"""
+        if s1 is None:
+            return cls(area, ku, ten, None, None, None, "")
+        return cls(area, ku, ten, s1, s2, f"({s1}, {s2})", f"{s1:02X} {s2:02X}")
+
+    def as_dict(self):
+        """Return the details as a plain dict, e.g. for JSON display"""
+        return {
+            'area': self.area,
+            'ku': self.ku,
+            'ten': self.ten,
+            'sjis_bytes': self.sjis_bytes,
+            'sjis_hex': self.sjis_hex
+        }
+
+
+@lru_cache(maxsize=8192)
+def _convert_cached(jis_input):
+    """
+    Cached implementation of convert_jis_code
     
     Args:
         jis_input (str): 5-digit JIS code string
@@ -95,35 +295,98 @@ def convert_jis_code(jis_input):
     
     try:
         # Validate input format
-        if not jis_input.isdigit() or len(jis_input) != 5:
+        if not _FIVE_DIGIT(jis_input):
             return False, "Input must be exactly 5 digits", None
         
-        # Parse area, ku, ten
-        m = int(jis_input[0])        # Area (1st digit)
-        k = int(jis_input[1:3])      # Ku (2nd-3rd digits)  
-        t = int(jis_input[3:5])      # Ten (4th-5th digits)
+        # Parse area, ku, ten from the ASCII digit values (ord('0') == 48)
+        b = jis_input.encode('ascii')
+        m = b[0] - 48                           # Area (1st digit)
+        k = (b[1] - 48) * 10 + (b[2] - 48)      # Ku (2nd-3rd digits)
+        t = (b[3] - 48) * 10 + (b[4] - 48)      # Ten (4th-5th digits)
         
-        debug_info = {
-            'area': m,
-            'ku': k,
-            'ten': t,
-            'sjis_bytes': None,
-            'sjis_hex': ""
-        }
+        # Fast path: precomputed character for a valid code
+        unicode_char = _lut_char(m * 10000 + k * 100 + t)
+        if unicode_char is not None:
+            s1, s2 = jis_to_sjis(m, k, t)
+            return True, unicode_char, DebugInfo.build(m, k, t, s1, s2)
         
-        # Convert JIS to SJIS
-        s1, s2 = jis_to_sjis(m, k, t)
-        debug_info['sjis_bytes'] = f"({s1}, {s2})"
-        debug_info['sjis_hex'] = f"{s1:02X} {s2:02X}"
+        # Slow path: recompute to report why the code is invalid
+        sjis = jis_to_sjis(m, k, t)
+        if sjis is None:
+            debug_info = DebugInfo.build(m, k, t)
+            return False, f"Conversion error: {_invalid_code_reason(m, k, t)}", debug_info
+        
+        s1, s2 = sjis
+        debug_info = DebugInfo.build(m, k, t, s1, s2)
         
         # Convert SJIS to Unicode
         unicode_char = sjis_to_unicode(s1, s2)
+        if unicode_char is None:
+            return False, (
+                f"Character encoding error: bytes {s1:02X} {s2:02X} "
+                "are not a valid SJIS2004 character"
+            ), debug_info
         
         return True, unicode_char, debug_info
         
-    except UnicodeDecodeError as e:
-        return False, f"Character encoding error: {str(e)}", debug_info
-    except ValueError as e:
-        return False, f"Conversion error: {str(e)}", debug_info
     except Exception as e:
         return False, f"Unexpected error: {str(e)}", debug_info
+
+
+def convert_jis_code(jis_input):
+    """
+    Convert a 5-digit JIS area-ku-ten code to Unicode character
+    
+    Args:
+        jis_input (str): 5-digit JIS code string
+    
+    Returns:
+        tuple: (success, result_or_error, debug_info) where debug_info is a
+        DebugInfo or None
+    """
+    if not isinstance(jis_input, str):
+        return False, "Input must be exactly 5 digits", None
+    
+    return _convert_cached(jis_input)
+
+
+@lru_cache(maxsize=None)
+def _flat_lut():
+    """
+    Build the NumPy view of the lookup table used by convert_jis_batch
+
+    Returns:
+        numpy.ndarray: Object array indexed by the 5-digit code as an integer,
+        holding the character or None
+    """
+    import numpy as np
+    
+    lut = np.full(100000, None, dtype=object)
+    lut[:_LUT_ENTRIES] = [_lut_char(i) for i in range(_LUT_ENTRIES)]
+    return lut
+
+
+def convert_jis_batch(codes):
+    """
+    Convert many 5-digit JIS area-ku-ten codes at once (requires NumPy)
+    
+    Args:
+        codes (Iterable[str]): 5-digit JIS code strings
+    
+    Returns:
+        numpy.ndarray: Object array of Unicode characters in input order,
+        with None for codes that have no SJIS2004 character
+    
+    Raises:
+        ValueError: If any code is not exactly 5 ASCII digits
+    """
+    import numpy as np
+    
+    codes = list(codes)  # Iterators would be used up by validation
+    if not all(map(_FIVE_DIGIT, codes)):
+        raise ValueError("Every code must be exactly 5 digits")
+    
+    packed = "".join(codes).encode("ascii")
+    digits = np.frombuffer(packed, dtype=np.uint8).reshape(-1, 5) - 48
+    index = digits.astype(np.intp) @ np.array([10000, 1000, 100, 10, 1], dtype=np.intp)
+    return _flat_lut()[index]
@@ -0,0 +1,121 @@
+"""
+Tests for the JIS to SJIS2004 conversion utilities
+"""
+
+import pytest
+
+import convert
+
+
+def test_shipped_lut_matches_formulas():
+    """lut.bin must be regenerated whenever the conversion changes"""
+    with open(convert._LUT_PATH, "rb") as f:
+        assert f.read() == convert._build_lut_bytes()
+
+
+@pytest.mark.parametrize("code, expected", [
+    ("10101", "\u3000"),
+    ("12345", "\u7566"),
+    ("20101", "\U00020089"),
+    ("10487", "\u304b\u309a"),  # Decodes to base character + combining mark
+])
+def test_convert_jis_code_characters(code, expected):
+    assert convert.convert_jis_code(code)[:2] == (True, expected)
+
+
+@pytest.mark.parametrize("code, message", [
+    ("30101", "Conversion error: Invalid area number: 3. Must be 1 or 2."),
+    ("00101", "Conversion error: Invalid area number: 0. Must be 1 or 2."),
+    ("10001", "Conversion error: Invalid ku number: 0. Must be between 1 and 94."),
+    ("19501", "Conversion error: Invalid ku number: 95. Must be between 1 and 94."),
+    ("10100", "Conversion error: Invalid ten number: 0. Must be between 1 and 94."),
+    ("10195", "Conversion error: Invalid ten number: 95. Must be between 1 and 94."),
+    ("20201", "Conversion error: Invalid input for JIS to Shift JIS conversion."),
+    ("10492", "Character encoding error: bytes 82 FA are not a valid SJIS2004 character"),
+])
+def test_convert_jis_code_errors(code, message):
+    assert convert.convert_jis_code(code)[:2] == (False, message)
+
+
+def test_convert_jis_code_debug_info():
+    success, _, debug_info = convert.convert_jis_code("10101")
+    assert success
+    assert debug_info.as_dict() == {
+        'area': 1,
+        'ku': 1,
+        'ten': 1,
+        'sjis_bytes': "(129, 64)",
+        'sjis_hex': "81 40"
+    }
+    
+    assert convert.convert_jis_code("10492")[2] == convert.DebugInfo(
+        1, 4, 92, 0x82, 0xFA, "(130, 250)", "82 FA"
+    )
+    assert convert.convert_jis_code("30101")[2].as_dict() == {
+        'area': 3,
+        'ku': 1,
+        'ten': 1,
+        'sjis_bytes': None,
+        'sjis_hex': ""
+    }
+
+
+@pytest.mark.parametrize("code", ["", "1010", "101010", "1010a", "10101\n", "١٠١٠١", None])
+def test_convert_jis_code_rejects_non_five_ascii_digits(code):
+    assert convert.convert_jis_code(code) == (False, "Input must be exactly 5 digits", None)
+
+
+def test_sjis_to_unicode_decodes_pairs_outside_the_pair_table():
+    assert convert.sjis_to_unicode(0x41, 0x42) == "AB"
+
+
+def test_sjis_to_unicode_returns_none_for_undecodable_pair():
+    assert convert.sjis_to_unicode(0x82, 0xFA) is None
+
+
+def test_convert_jis_batch():
+    np = pytest.importorskip("numpy")
+    
+    result = convert.convert_jis_batch(["10101", "20101", "10000"])
+    assert isinstance(result, np.ndarray)
+    assert list(result) == ["　", "\U00020089", None]
+
+
+def test_convert_jis_batch_empty():
+    pytest.importorskip("numpy")
+    
+    assert len(convert.convert_jis_batch([])) == 0
+
+
+def test_convert_jis_batch_accepts_iterators():
+    pytest.importorskip("numpy")
+    
+    codes = (code for code in ["10101", "10102"])
+    assert list(convert.convert_jis_batch(codes)) == ["　", "、"]
+
+
+@pytest.mark.parametrize("code", ["1010", "101010", "1010a", "١٢٣٤٥"])
+def test_convert_jis_batch_rejects_invalid_codes(code):
+    pytest.importorskip("numpy")
+    
+    with pytest.raises(ValueError):
+        convert.convert_jis_batch(["10101", code])
+
+
+def _expected_batch(codes):
+    """Characters convert_jis_code gives for codes, None on failure"""
+    expected = []
+    for code in codes:
+        success, result, _ = convert.convert_jis_code(code)
+        expected.append(result if success else None)
+    return expected
+
+
+ALL_CODES = [f"{i:05d}" for i in range(100000)]
+
+
+def test_convert_jis_batch_matches_convert_jis_code():
+    pytest.importorskip("numpy")
+    
+    assert list(convert.convert_jis_batch(ALL_CODES)) == _expected_batch(ALL_CODES)
+
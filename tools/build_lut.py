@@ -0,0 +1,26 @@
+"""
+Generate lut.bin, the precomputed JIS code to character table used by convert.py
+
+Run from the repository root after changing the conversion formulas:
+
+    python tools/build_lut.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import convert
+
+
+def main():
+    """Write lut.bin next to convert.py"""
+    data = convert._build_lut_bytes()
+    with open(convert._LUT_PATH, "wb") as f:
+        f.write(data)
+    print(f"Wrote {len(data)} bytes to {convert._LUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()